@@ -19,10 +19,12 @@ from .static_analysis.network_security import (
 from .static_analysis.permissions import categorize_permissions
 
 # Core imports (required)
-from .static_analysis.static import analyze_apk
+from .static_analysis.static import StaticAnalysisResult, analyze_apk, run_static_analysis
 
 __all__ = [
     "analyze_apk",
+    "run_static_analysis",
+    "StaticAnalysisResult",
     "extract_permissions",
     "extract_permission_details",
     "extract_components",
@@ -1,6 +1,10 @@
 """Entry points for static APK analysis."""
 
-from platform.android.analysis.static.pipeline import analyze_apk
+from platform.android.analysis.static.pipeline import (
+    StaticAnalysisResult,
+    analyze_apk,
+    run_static_analysis,
+)
 
-__all__ = ["analyze_apk"]
+__all__ = ["analyze_apk", "run_static_analysis", "StaticAnalysisResult"]
 
@@ -1,5 +1,16 @@
 """CLI package for Android Tool menus and actions."""
 
-from .menu import run_main_menu
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["run_main_menu"]
+
+
+def __getattr__(name: str) -> Any:
+    # Deferred so ``python -m cli.actions`` does not load the interactive menu.
+    if name == "run_main_menu":
+        from .menu import run_main_menu
+
+        return run_main_menu
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
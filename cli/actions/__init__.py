@@ -1,21 +1,34 @@
-"""Collection of CLI action helpers split across modules."""
-
-from .analysis import analyze_apk_path, analyze_installed_app
-from .device import (
-    capture_screenshot,
-    export_device_report,
-    list_installed_packages,
-    list_running_processes,
-    quick_security_scan,
-    scan_dangerous_permissions,
-    scan_for_devices,
-    show_connected_devices,
-    show_detailed_devices,
-    show_network_connections,
-)
-from .health import run_health_check
-from .server import launch_web_app, run_server, show_database_status
-from .system import run_doctor
+"""Collection of CLI action helpers split across modules.
+
+Actions are resolved from their submodules on first access, so importing the
+package (for example to build the menu or print ``--help``) does not load the
+analysis, device and server stacks until an action actually runs.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_LAZY = {
+    "analyze_apk_path": ".analysis",
+    "analyze_installed_app": ".analysis",
+    "capture_screenshot": ".device",
+    "export_device_report": ".device",
+    "list_installed_packages": ".device",
+    "list_running_processes": ".device",
+    "quick_security_scan": ".device",
+    "scan_dangerous_permissions": ".device",
+    "scan_for_devices": ".device",
+    "show_connected_devices": ".device",
+    "show_detailed_devices": ".device",
+    "show_network_connections": ".device",
+    "run_health_check": ".health",
+    "launch_web_app": ".server",
+    "run_server": ".server",
+    "show_database_status": ".server",
+    "run_doctor": ".system",
+}
 
 __all__ = [
     "run_doctor",
@@ -36,3 +49,17 @@ __all__ = [
     "show_database_status",
     "run_health_check",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
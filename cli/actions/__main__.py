@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-import argparse
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from settings import get_settings
+if TYPE_CHECKING:  # pragma: no cover
+    import argparse
 
-from . import list_installed_packages, run_server
 
+@lru_cache(maxsize=1)
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the argument parser once; later ``main`` calls reuse it."""
+    import argparse
 
-def main(argv: list[str] | None = None) -> None:
-    """Minimal CLI for auxiliary commands."""
     parser = argparse.ArgumentParser(description="Rotterdam utilities")
     sub = parser.add_subparsers(dest="cmd")
 
-    s = get_settings()
+    # Unset host/port fall back to settings inside ``serve``.
     p_serve = sub.add_parser("serve", help="start API server")
-    p_serve.add_argument("--host", default=s.host)
-    p_serve.add_argument("--port", type=int, default=s.port)
+    p_serve.add_argument("--host")
+    p_serve.add_argument("--port", type=int)
 
     p_list = sub.add_parser("list-packages", help="list installed packages")
     p_list.add_argument("serial", help="device serial")
@@ -27,12 +30,24 @@ def main(argv: list[str] | None = None) -> None:
     p_list.add_argument("--regex", help="filter packages by regex")
     p_list.add_argument("--csv", help="export results to CSV at path")
     p_list.add_argument("--json", dest="json_path", help="export results to JSON")
+    p_list.add_argument("--pretty", action="store_true", help="indent the JSON export")
     p_list.add_argument("--limit", type=int, help="limit number of results")
+    return parser
 
+
+def main(argv: list[str] | None = None) -> None:
+    """Minimal CLI for auxiliary commands."""
+    parser = _build_parser()
     args = parser.parse_args(argv)
+    # Import only the action for the chosen subcommand; ``--help`` and usage
+    # errors never load the device or server stacks.
     if args.cmd == "serve":
+        from . import run_server
+
         run_server(args.host, args.port)
     elif args.cmd == "list-packages":
+        from . import list_installed_packages
+
         list_installed_packages(
             args.serial,
             user=args.user,
@@ -42,6 +57,7 @@ def main(argv: list[str] | None = None) -> None:
             csv_path=args.csv,
             json_path=args.json_path,
             limit=args.limit,
+            pretty=args.pretty,
         )
     else:
         parser.print_help()
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from analysis import analyze_apk
 from app_config import app_config
 from devices import apk, packages
 from utils.display_utils import display
@@ -12,7 +16,53 @@ from utils.reporting_utils import ieee
 
 from ..prompts import prompt_existing_path
 from .utils import action_context as _action_context
-from .utils import logger
+from .utils import log_context, logger
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ijson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ijson = None
+
+# Both parsers accept bytes directly, avoiding a separate UTF-8 decode step.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Reused for the three artifact reads so each display does not spin up threads.
+_MANIFEST_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="manifest-io")
+
+# ``(components, features, report)`` as shown by _display_manifest_insights.
+_ManifestBundle = Tuple[Dict[str, Any], List[Any], Dict[str, Any]]
+
+# Manifest component kinds in display order, with their section titles.
+_COMPONENT_KINDS = (
+    ("activity", "Activities"),
+    ("service", "Services"),
+    ("receiver", "Receivers"),
+    ("provider", "Providers"),
+)
+_KIND_TITLES = dict(_COMPONENT_KINDS)
+
+# Friendly suffixes for packages whose ids do not match their brand name.
+_LABEL_HINTS = {"com.twitter.android": " (Twitter)"}
+
+# Installed package listings per serial, so backing out of the package menu
+# and reopening it does not run ``pm list packages`` again.
+_PACKAGES_TTL = 10.0
+_package_paths_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+
+def _installed_package_paths(serial: str) -> Dict[str, str]:
+    """Return ``{package: apk_path}`` for ``serial``, reusing a fresh listing."""
+    now = time.monotonic()
+    cached = _package_paths_cache.get(serial)
+    if cached is None or now - cached[0] >= _PACKAGES_TTL:
+        cached = (now, packages.list_installed_package_paths(serial))
+        _package_paths_cache[serial] = cached
+    return cached[1]
 
 
 def analyze_apk_path() -> None:
@@ -24,22 +74,27 @@ def analyze_apk_path() -> None:
     if not apk_path:
         return
 
+    # The static analysis pipeline pulls in androguard, YARA and friends; only
+    # pay for that import once an analysis is actually requested.
+    from analysis import run_static_analysis
+
     app_name = Path(apk_path).stem
     with _action_context("analyze_apk_path", apk_path=apk_path):
         logger.info("analyze_apk_path", extra={"apk": apk_path})
         outdir = app_config.OUTPUT_DIR / app_config.ts()
         try:
-            out = analyze_apk(apk_path, outdir=outdir)
+            result = run_static_analysis(apk_path, outdir=outdir)
         except Exception as e:  # pragma: no cover - broad catch for user feedback
             logger.exception("analysis failed")
             display.fail(f"Analysis failed: {e}")
             return
+        out = result.outdir
         report_path = out / "report.json"
         # Database storage has been removed for the MVP, so the report path is
         # not persisted.  Future iterations may reintroduce this functionality.
         logger.info("analysis completed", extra={"output": str(out)})
         print(f"Status: Static analysis completed. Report at {report_path}")
-        _display_manifest_insights(out)
+        _display_manifest_insights(out, (result.components, result.features, result.report))
 
 
 def analyze_installed_app(serial: str) -> None:
@@ -47,50 +102,62 @@ def analyze_installed_app(serial: str) -> None:
     with _action_context("analyze_installed_app", device_serial=serial):
         logger.info("analyze_installed_app")
         try:
-            pkgs = packages.list_installed_packages(serial)
+            apk_paths = _installed_package_paths(serial)
         except RuntimeError as e:
             logger.exception("failed to list installed packages")
             display.fail(str(e))
             return
+        pkgs = list(apk_paths)
         if not pkgs:
             logger.info("no packages found")
             print("Status: No packages found.")
             return
 
-        options = [
-            (pkg + (" (Twitter)" if pkg == "com.twitter.android" else ""), pkg) for pkg in pkgs
-        ]
-        choice = display.show_menu(
-            "Installed Packages",
-            [label for label, _ in options],
-            exit_label="Cancel",
-            prompt="Select package",
-        )
-        if choice == 0:
-            logger.info("no package selected")
-            print("Status: No package selected.")
-            return
-        package = options[choice - 1][1]
+        if len(pkgs) == 1:
+            # Nothing to choose between; skip rendering and waiting on the menu.
+            package = pkgs[0]
+            logger.info("auto-selecting sole package", extra={"package": package})
+        else:
+            labels = [pkg + _LABEL_HINTS.get(pkg, "") for pkg in pkgs]
+            choice = display.show_menu(
+                "Installed Packages",
+                labels,
+                exit_label="Cancel",
+                prompt="Select package",
+            )
+            if choice == 0:
+                logger.info("no package selected")
+                print("Status: No package selected.")
+                return
+            package = pkgs[choice - 1]
+
+        from analysis import run_static_analysis
 
         outdir = app_config.OUTPUT_DIR / app_config.ts()
         try:
-            evidence = apk.acquire_apk(serial, package, dest_dir=str(outdir))
+            evidence = apk.acquire_apk(
+                serial, package, dest_dir=str(outdir), remote_path=apk_paths[package]
+            )
+            # A completed pull means the next visit should see a fresh listing.
+            _package_paths_cache.pop(serial, None)
             apk_path = str(evidence["artifact"])
             logger.info("apk extracted", extra={"output": str(outdir)})
             print("Status: Application package extracted successfully.")
-            with _action_context("analyze_installed_app", device_serial=serial, apk_path=apk_path):
-                out = analyze_apk(apk_path, outdir=outdir)
+            # Action and device are already bound by the enclosing context.
+            with log_context(apk_path=apk_path):
+                result = run_static_analysis(apk_path, outdir=outdir)
         except Exception as e:  # pragma: no cover
             logger.exception("analysis failed")
             display.fail(f"Analysis failed: {e}")
             return
 
+        out = result.outdir
         report_path = out / "report.json"
         # Storage of analysis metadata is temporarily disabled in the CLI-only
         # phase.
         logger.info("analysis completed", extra={"report": str(report_path)})
         print(f"Status: Static analysis completed. Report at {report_path}")
-        _display_manifest_insights(out)
+        _display_manifest_insights(out, (result.components, result.features, result.report))
         log = ieee.format_evidence_log([evidence])
         print(log)
 
@@ -105,20 +172,89 @@ def explore_installed_app(serial: str) -> None:
     print("Sandbox features are disabled.")
 
 
-def _display_manifest_insights(outdir: Path) -> None:
-    """Load manifest-derived data and display tables."""
+def _load_json(path: str) -> Any:
+    """Parse a JSON artifact, returning ``None`` if it is missing or unreadable."""
     try:
-        components = json.loads((outdir / "components.json").read_text())
-    except Exception:
-        components = {}
+        # Whole-file read: an unbuffered FileIO skips the BufferedReader layer.
+        with open(path, "rb", buffering=0) as fh:
+            return _json_loads(fh.readall())
+    except (OSError, ValueError):  # unreadable, or not valid JSON / UTF-8
+        return None
+
+
+# The only sections of report.json shown after an analysis.
+_REPORT_KEYS = frozenset({"metrics", "diff"})
+
+
+def _load_report(path: str) -> Any:
+    """Parse the displayed sections of ``report.json``.
+
+    With ``ijson`` installed the report is streamed and only ``metrics`` and
+    ``diff`` are materialised, stopping once both have been seen; otherwise
+    the whole document is parsed.
+    """
+    if ijson is None:
+        return _load_json(path)
+    found: Dict[str, Any] = {}
     try:
-        features = json.loads((outdir / "features.json").read_text())
-    except Exception:
-        features = []
+        with open(path, "rb") as fh:
+            for key, value in ijson.kvitems(fh, "", use_float=True):
+                if key in _REPORT_KEYS:
+                    found[key] = value
+                    if len(found) == len(_REPORT_KEYS):
+                        break
+    except (OSError, ValueError, ijson.JSONError):
+        return None
+    return found
+
+
+def _mtime(path: str) -> Optional[int]:
     try:
-        report = json.loads((outdir / "report.json").read_text())
-    except Exception:
-        report = {}
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _cached_manifest_bundle(
+    paths: Tuple[str, ...], mtimes: Tuple[Optional[int], ...]
+) -> _ManifestBundle:
+    # A ``None`` mtime means the stat already found no file; skip opening it.
+    loaders = (_load_json, _load_json, _load_report)
+    futures = [
+        _MANIFEST_POOL.submit(load, path) if mtime is not None else None
+        for load, path, mtime in zip(loaders, paths, mtimes)
+    ]
+    components, features, report = (f.result() if f is not None else None for f in futures)
+    return components or {}, features or [], report or {}
+
+
+def _load_manifest_bundle(outdir: Path) -> _ManifestBundle:
+    """Return ``(components, features, report)`` parsed from ``outdir``.
+
+    Results are memoised on the artifact paths and modification times, so
+    showing an unchanged analysis again skips the reads and JSON parsing.
+    """
+    base = os.fspath(outdir)
+    paths = tuple(
+        os.path.join(base, name) for name in ("components.json", "features.json", "report.json")
+    )
+    mtimes = tuple(_mtime(p) for p in paths)
+    if mtimes == (None, None, None):
+        # Failed or cancelled analysis: nothing to load, cache or hand to the pool.
+        return {}, [], {}
+    return _cached_manifest_bundle(paths, mtimes)
+
+
+def _display_manifest_insights(outdir: Path, bundle: Optional[_ManifestBundle] = None) -> None:
+    """Display manifest-derived tables for an analysis in ``outdir``.
+
+    ``bundle`` is ``(components, features, report)`` when the caller already
+    holds them, e.g. straight after an analysis; otherwise they are loaded.
+    """
+    components, features, report = bundle or _load_manifest_bundle(outdir)
+    if not (components or features or report):
+        return
 
     metrics: Dict[str, Any] = report.get("metrics", {})
     diff: Dict[str, Any] = report.get("diff", {})
@@ -129,22 +265,19 @@ def _display_manifest_insights(outdir: Path) -> None:
         display.print_table(rows, headers=["Feature", "Required"])
 
     if components:
-        for kind in ["activity", "service", "receiver", "provider"]:
-            if components.get(kind):
-                display.print_section(f"{kind.title()}s")
-                rows = [
-                    [
-                        c.get("name", ""),
-                        "yes" if c.get("exported") else "no",
-                        c.get("permission", ""),
-                    ]
-                    for c in components.get(kind, [])
-                ]
-                display.print_table(rows, headers=["Name", "Exported", "Permission"])
+        for kind, title in _COMPONENT_KINDS:
+            items = components.get(kind)
+            if not items:
+                continue
+            display.print_section(title)
+            _print_component_table(items)
 
     if metrics:
         display.print_section("Derived Metrics")
-        rows = [[k, str(v)] for k, v in sorted(metrics.items()) if not isinstance(v, dict)]
+        # Drop nested sections before sorting so only scalar metrics are ordered.
+        flat = [(k, v) for k, v in metrics.items() if not isinstance(v, dict)]
+        flat.sort()
+        rows = [[k, str(v)] for k, v in flat]
         display.print_table(rows, headers=["Metric", "Value"])
         prefix_counts = metrics.get("permission_prefix_counts")
         if prefix_counts:
@@ -156,15 +289,42 @@ def _display_manifest_insights(outdir: Path) -> None:
 
     if diff:
         display.print_section("Differences from Previous Version")
-        added_perms = diff.get("added_permissions", [])
-        removed_perms = diff.get("removed_permissions", [])
-        if added_perms:
-            print("Added permissions: " + ", ".join(added_perms))
-        if removed_perms:
-            print("Removed permissions: " + ", ".join(removed_perms))
-        for kind, names in diff.get("added_components", {}).items():
-            if names:
-                print(f"Added {kind.title()}s: {', '.join(names)}")
-        for kind, names in diff.get("removed_components", {}).items():
-            if names:
-                print(f"Removed {kind.title()}s: {', '.join(names)}")
+        _print_diff(diff)
+
+
+def _print_diff(diff: Dict[str, Any]) -> None:
+    """Write the version diff as ``Added/Removed <kind>: a, b, ...`` lines."""
+    sys.stdout.writelines(_diff_fragments(diff))
+
+
+def _diff_fragments(diff: Dict[str, Any]) -> Iterator[str]:
+    # Names are yielded piecewise so long diffs never build a joined string.
+    sections: List[Tuple[str, Any]] = [
+        ("Added permissions", diff.get("added_permissions")),
+        ("Removed permissions", diff.get("removed_permissions")),
+    ]
+    for verb, key in (("Added", "added_components"), ("Removed", "removed_components")):
+        for kind, names in (diff.get(key) or {}).items():
+            title = _KIND_TITLES.get(kind) or f"{kind.title()}s"
+            sections.append((f"{verb} {title}", names))
+    for label, names in sections:
+        if not names:
+            continue
+        yield label
+        sep = ": "
+        for name in names:
+            yield sep
+            yield name
+            sep = ", "
+        yield "\n"
+
+
+def _component_row(c: Dict[str, Any]) -> Tuple[str, str, str]:
+    get = c.get
+    return get("name", ""), "yes" if get("exported") else "no", get("permission", "")
+
+
+def _print_component_table(items: List[Dict[str, Any]]) -> None:
+    """Render one kind of manifest component already pulled from ``components``."""
+    # print_table stringifies rows as it consumes them; no intermediate list.
+    display.print_table(map(_component_row, items), headers=["Name", "Exported", "Permission"])
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import csv
+import heapq
 import json
 import re
 import subprocess
-from typing import Optional
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from app_config import app_config
 from devices import adb, packages, processes, selection, service
@@ -14,6 +20,133 @@ from utils.reporting_utils import ieee
 from .utils import action_context as _action_context
 from .utils import logger
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Columns exported by ``list_installed_packages --csv``.  Every dict produced by
+# ``inventory_packages`` carries all of these keys, so rows are pulled out
+# positionally in one C-level call instead of going through ``DictWriter``.
+_INVENTORY_CSV_FIELDS = (
+    "package",
+    "version_name",
+    "installer",
+    "uid",
+    "system",
+    "priv",
+    "high_value",
+    "categories",
+    "risk_score",
+    "dangerous_permissions",
+)
+_inventory_csv_row = itemgetter(*_INVENTORY_CSV_FIELDS)
+
+# Consecutive filtered views of one device (--user, then --system, ...) reuse a
+# recent inventory rather than re-running pm list/dumpsys for every package.
+# The TTL bounds staleness from apps installed in the meantime; expired entries
+# are dropped on refresh and at most ``_INVENTORY_MAX`` devices are kept.
+_INVENTORY_TTL = 30.0
+_INVENTORY_MAX = 8
+_inventory_cache: Dict[str, tuple[float, List[Dict[str, Any]]]] = {}
+
+
+def _json_line(record: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE).decode()
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _interactive() -> bool:
+    """Return True when stdout is a terminal rather than a pipe or file.
+
+    Checked per call so a redirected ``sys.stdout`` is honoured. When piped, the
+    consumer is another program: listings are written as JSON lines and the
+    table layout pass is skipped, while diagnostics stay on stderr.
+    """
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _emit(
+    title: str,
+    records: Sequence[Dict[str, Any]],
+    headers: List[str],
+    row: Callable[[Dict[str, Any]], Sequence[Any]],
+    empty: str,
+) -> None:
+    """Render ``records`` as a table, or as JSON lines when stdout is piped."""
+    if not _interactive():
+        if records:
+            sys.stdout.write("".join(map(_json_line, records)))
+        return
+    display.print_section(title)
+    if not records:
+        print(empty)
+        return
+    display.print_table(map(row, records), headers=headers)
+
+
+def _inventory(serial: str) -> List[Dict[str, Any]]:
+    """Return the package inventory for ``serial``, reusing a fresh cached copy."""
+    now = time.monotonic()
+    cached = _inventory_cache.get(serial)
+    if cached is None or now - cached[0] >= _INVENTORY_TTL:
+        cached = (now, service.list_packages(serial))
+        for key, (stamp, _) in list(_inventory_cache.items()):
+            if now - stamp >= _INVENTORY_TTL:
+                del _inventory_cache[key]
+        _inventory_cache.pop(serial, None)
+        while len(_inventory_cache) >= _INVENTORY_MAX:
+            # Dicts keep insertion order, so the first entry is the oldest.
+            del _inventory_cache[next(iter(_inventory_cache))]
+        _inventory_cache[serial] = cached
+    # Callers sort and slice the list in place; hand out a shallow copy.
+    return list(cached[1])
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Return ``pattern`` compiled, reusing earlier compilations in this process."""
+    return re.compile(pattern)
+
+
+def _inventory_rank(p: Dict[str, Any]) -> tuple[bool, bool, str]:
+    """Sort key: high-value apps first, then user apps, then by name.
+
+    ``sort``/``nsmallest`` evaluate this once per package; ``False`` orders
+    before ``True`` so the flags can be used directly without branching.
+    """
+    return (not p.get("high_value"), bool(p.get("system")), p.get("package", ""))
+
+
+def _inventory_table_row(p: Dict[str, Any]) -> List[Any]:
+    return [
+        p.get("package", ""),
+        p.get("version_name", ""),
+        p.get("installer", ""),
+        p.get("uid", ""),
+        "yes" if p.get("system") else "no",
+        "yes" if p.get("priv") else "no",
+        "yes" if p.get("high_value") else "no",
+        ", ".join(p.get("categories", [])),
+        p.get("risk_score", 0),
+    ]
+
+
+# ``parse_ps`` always yields these keys, so rows are pulled out in one C call.
+_process_row = itemgetter("pid", "user", "name")
+
+# Device table columns; optional identifiers show "-" when unknown.
+_DEVICE_HEADERS = ["Serial", "State", "Product", "Model", "Device", "Transport"]
+_device_ids = attrgetter("product", "model", "device", "transport_id")
+
+
+def _device_row(d: Any) -> List[Any]:
+    return [d.serial, d.state, *[v or "-" for v in _device_ids(d)]]
+
 
 def show_connected_devices() -> None:
     """List connected devices using basic ``adb devices`` output."""
@@ -32,28 +165,7 @@ def show_connected_devices() -> None:
             print("No devices attached.")
             return
 
-        rows = [
-            [
-                d.serial,
-                d.state,
-                d.product or "-",
-                d.model or "-",
-                d.device or "-",
-                d.transport_id or "-",
-            ]
-            for d in devs
-        ]
-        display.print_table(
-            rows,
-            headers=[
-                "Serial",
-                "State",
-                "Product",
-                "Model",
-                "Device",
-                "Transport",
-            ],
-        )
+        display.print_table(map(_device_row, devs), headers=_DEVICE_HEADERS)
 
 
 def show_detailed_devices() -> None:
@@ -88,64 +200,52 @@ def list_installed_packages(
     csv_path: Optional[str] = None,
     json_path: Optional[str] = None,
     limit: Optional[int] = None,
+    pretty: bool = False,
 ) -> None:
-    """Display packages installed on the device."""
+    """Display packages installed on the device.
+
+    JSON exports are compact unless ``pretty`` is set.
+    """
     with _action_context("list_installed_packages", device_serial=serial):
         logger.info("list_installed_packages")
         try:
-            pkg_info = service.list_packages(serial)
+            pkg_info = _inventory(serial)
         except RuntimeError as e:
             logger.exception("failed to inventory packages")
             display.fail(str(e))
             return
 
-        if user:
-            pkg_info = [p for p in pkg_info if not p.get("system")]
-        if system:
-            pkg_info = [p for p in pkg_info if p.get("system")]
-        if high_value:
-            pkg_info = [p for p in pkg_info if p.get("high_value")]
+        pattern = None
         if regex:
             try:
-                pattern = re.compile(regex)
-                pkg_info = [p for p in pkg_info if pattern.search(p.get("package", ""))]
+                pattern = _compile_pattern(regex)
             except re.error as exc:
                 display.fail(f"Invalid regex: {exc}")
                 return
+        if user or system or high_value or pattern is not None:
+            # Apply every requested filter in a single pass over the inventory.
+            pkg_info = [
+                p
+                for p in pkg_info
+                if not (user and p.get("system"))
+                and not (system and not p.get("system"))
+                and not (high_value and not p.get("high_value"))
+                and (pattern is None or pattern.search(p.get("package", "")))
+            ]
 
-        pkg_info.sort(
-            key=lambda p: (
-                0 if p.get("high_value") else 1,
-                0 if not p.get("system") else 1,
-                p.get("package", ""),
-            )
-        )
-        if limit is not None:
-            pkg_info = pkg_info[:limit]
-
-        display.print_section("Application Inventory")
-        if not pkg_info:
-            logger.info("no packages found")
-            print("No packages found.")
-            return
-
-        rows = [
+        # Only the top ``limit`` entries survive, so avoid sorting the whole
+        # inventory when that is a small slice of it.
+        if limit is not None and 0 <= limit < len(pkg_info) // 4:
+            pkg_info = heapq.nsmallest(limit, pkg_info, key=_inventory_rank)
+        else:
+            pkg_info.sort(key=_inventory_rank)
+            if limit is not None:
+                pkg_info = pkg_info[:limit]
+
+        _emit(
+            "Application Inventory",
+            pkg_info,
             [
-                p.get("package", ""),
-                p.get("version_name", ""),
-                p.get("installer", ""),
-                p.get("uid", ""),
-                "yes" if p.get("system") else "no",
-                "yes" if p.get("priv") else "no",
-                "yes" if p.get("high_value") else "no",
-                ", ".join(p.get("categories", [])),
-                p.get("risk_score", 0),
-            ]
-            for p in pkg_info
-        ]
-        display.print_table(
-            rows,
-            headers=[
                 "Package",
                 "Version",
                 "Installer",
@@ -156,42 +256,78 @@ def list_installed_packages(
                 "Categories",
                 "Risk",
             ],
+            _inventory_table_row,
+            "No packages found.",
         )
+        if not pkg_info:
+            logger.info("no packages found")
+            return
 
-        total = len(pkg_info)
-        flagged = sum(1 for p in pkg_info if p.get("risk_score", 0) > 0)
-        display.note(f"Total packages: {total}")
-        display.note(f"Flagged packages: {flagged}")
-
-        if csv_path:
+        if _interactive():
+            total = len(pkg_info)
+            flagged = sum(1 for p in pkg_info if p.get("risk_score", 0) > 0)
+            display.note(f"Total packages: {total}")
+            display.note(f"Flagged packages: {flagged}")
+
+        _export_inventory(pkg_info, csv_path=csv_path, json_path=json_path, pretty=pretty)
+
+
+def _write_inventory_csv(pkg_info: List[Dict[str, Any]], path: str) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(_INVENTORY_CSV_FIELDS)
+        writer.writerows(map(_inventory_csv_row, pkg_info))
+
+
+def _write_inventory_json(pkg_info: List[Dict[str, Any]], path: str, pretty: bool) -> None:
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(pkg_info, option=option))
+        return
+    # json.dump issues a write per encoded fragment; encode once and write once,
+    # compact and UTF-8 like the orjson path.
+    text = json.dumps(
+        pkg_info,
+        indent=2 if pretty else None,
+        separators=None if pretty else (",", ":"),
+        ensure_ascii=False,
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+
+
+def _export_inventory(
+    pkg_info: List[Dict[str, Any]],
+    *,
+    csv_path: Optional[str] = None,
+    json_path: Optional[str] = None,
+    pretty: bool = False,
+) -> None:
+    """Write the requested CSV/JSON exports, overlapping them when both are set."""
+    exports = [
+        (label, writer, path)
+        for label, writer, path in (
+            ("CSV", _write_inventory_csv, csv_path),
+            ("JSON", partial(_write_inventory_json, pretty=pretty), json_path),
+        )
+        if path
+    ]
+    if not exports:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(exports)) as ex:
+        futures = [(label, ex.submit(writer, pkg_info, path)) for label, writer, path in exports]
+        for label, fut in futures:
             try:
-                with open(csv_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(
-                        f,
-                        fieldnames=[
-                            "package",
-                            "version_name",
-                            "installer",
-                            "uid",
-                            "system",
-                            "priv",
-                            "high_value",
-                            "categories",
-                            "risk_score",
-                            "dangerous_permissions",
-                        ],
-                    )
-                    writer.writeheader()
-                    writer.writerows(pkg_info)
+                fut.result()
             except OSError as e:
-                display.fail(f"Failed to write CSV: {e}")
+                display.fail(f"Failed to write {label}: {e}")
 
-        if json_path:
-            try:
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(pkg_info, f, indent=2)
-            except OSError as e:
-                display.fail(f"Failed to write JSON: {e}")
+
+def _permission_row(r: Dict[str, Any]) -> List[Any]:
+    # scan_for_dangerous_permissions always sets all four keys.
+    return [r["package"], ", ".join(r["permissions"]), ", ".join(r["categories"]), r["risk_score"]]
 
 
 def scan_dangerous_permissions(serial: str) -> None:
@@ -205,21 +341,15 @@ def scan_dangerous_permissions(serial: str) -> None:
             display.fail(str(e))
             return
 
-        display.print_section("Apps with Dangerous Permissions")
         if not risky:
             logger.info("no apps with dangerous permissions")
-            print("No apps requesting dangerous permissions found.")
-            return
-        rows = [
-            [
-                r.get("package", ""),
-                ", ".join(r.get("permissions", [])),
-                ", ".join(r.get("categories", [])),
-                r.get("risk_score", 0),
-            ]
-            for r in risky
-        ]
-        display.print_table(rows, headers=["Package", "Permissions", "Categories", "Risk"])
+        _emit(
+            "Apps with Dangerous Permissions",
+            risky,
+            ["Package", "Permissions", "Categories", "Risk"],
+            _permission_row,
+            "No apps requesting dangerous permissions found.",
+        )
 
 
 def scan_for_devices() -> None:
@@ -239,28 +369,7 @@ def scan_for_devices() -> None:
             print("No devices discovered.")
             return
 
-        rows = [
-            [
-                d.serial,
-                d.state,
-                d.product or "-",
-                d.model or "-",
-                d.device or "-",
-                d.transport_id or "-",
-            ]
-            for d in detailed
-        ]
-        display.print_table(
-            rows,
-            headers=[
-                "Serial",
-                "State",
-                "Product",
-                "Model",
-                "Device",
-                "Transport",
-            ],
-        )
+        display.print_table(map(_device_row, detailed), headers=_DEVICE_HEADERS)
 
 
 def export_device_report(serial: str) -> None:
@@ -284,14 +393,15 @@ def list_running_processes(serial: str) -> None:
             display.fail(str(e))
             return
 
-        display.print_section("Running Processes")
         if not procs:
             logger.info("no process data available")
-            print("No process data available.")
-            return
-
-        rows = [[p.get("pid", ""), p.get("user", ""), p.get("name", "")] for p in procs]
-        display.print_table(rows, headers=["PID", "User", "Name"])
+        _emit(
+            "Running Processes",
+            procs,
+            ["PID", "User", "Name"],
+            _process_row,
+            "No process data available.",
+        )
 
 
 def capture_screenshot(serial: str) -> None:
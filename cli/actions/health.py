@@ -1,26 +1,39 @@
 from __future__ import annotations
 
 import importlib
-import shutil
+import os
 import subprocess
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List
 
+from core.diagnostics import cached_which
 from settings import get_settings
 from utils.display_utils import display
-from database.db_core import DatabaseCore
-from database.db_config import DB_CONFIG
+
+if TYPE_CHECKING:  # pragma: no cover
+    from database.db_core import DatabaseCore
+
+
+@lru_cache(maxsize=8)
+def _adb_version(path: str, mtime_ns: int) -> str:
+    """Return the first line of ``adb version``; cached per binary and mtime."""
+    proc = subprocess.run([path, "version"], capture_output=True, text=True, timeout=2, check=True)
+    return (proc.stdout or "").splitlines()[0].strip()
 
 
 def _check_adb() -> tuple[bool, str]:
     path = get_settings().adb_bin
+    hint = f"adb missing (looked for {path}). Install platform-tools or set ADB env"
+    # ``adb_bin`` may be a bare command name; check the binary it resolves to.
+    resolved = cached_which(path) or path
+    if not os.access(resolved, os.X_OK):
+        return False, hint  # no point spawning a process that cannot exec
     try:
-        proc = subprocess.run(
-            [path, "version"], capture_output=True, text=True, timeout=2, check=True
-        )
-        line = (proc.stdout or "").splitlines()[0].strip()
+        # Keyed on mtime so an upgraded adb is picked up on the next check.
+        line = _adb_version(resolved, os.stat(resolved).st_mtime_ns)
         return True, line or path
     except Exception:
-        hint = f"adb missing (looked for {path}). Install platform-tools or set ADB env"
         return False, hint
 
 
@@ -33,14 +46,27 @@ def _check_module(name: str) -> tuple[bool, str]:
 
 
 def _check_binary(name: str) -> tuple[bool, str]:
-    path = shutil.which(name)
+    path = cached_which(name)
     if path:
         return True, path
     return False, f"{name} not found in PATH"
 
 
+@lru_cache(maxsize=1)
+def _db_core() -> "DatabaseCore":
+    """Return a process-wide database handle so repeat checks reuse its connection."""
+    # mysql-connector is only needed when the health check actually runs.
+    from database.db_core import DatabaseCore
+
+    # Cap the connect wait so an unreachable server cannot stall the report.
+    return DatabaseCore.from_config(connect_timeout=2)
+
+
 def _check_database() -> tuple[bool, str]:
-    core = DatabaseCore(DB_CONFIG)
+    try:
+        core = _db_core()
+    except ImportError as e:  # pragma: no cover - optional driver
+        return False, str(e)
     ok = core.ping()
     return ok, "connected" if ok else "unreachable"
 
@@ -48,12 +74,17 @@ def _check_database() -> tuple[bool, str]:
 def run_health_check() -> None:
     """Run read-only environment diagnostics."""
     display.print_section("Health Check")
-    checks: List[tuple[str, tuple[bool, str]]] = [
-        ("ADB", _check_adb()),
-        ("androguard", _check_module("androguard")),
-        ("apktool", _check_binary("apktool")),
-        ("database", _check_database()),
+    probes: List[tuple[str, Callable[[], tuple[bool, str]]]] = [
+        ("ADB", _check_adb),
+        ("androguard", lambda: _check_module("androguard")),
+        ("apktool", lambda: _check_binary("apktool")),
+        ("database", _check_database),
     ]
+    # The probes wait on subprocesses, imports and the network; run them side
+    # by side and report in the fixed order above.
+    with ThreadPoolExecutor(max_workers=len(probes)) as ex:
+        futures = [(name, ex.submit(probe)) for name, probe in probes]
+        checks = [(name, fut.result()) for name, fut in futures]
     for name, (ok, detail) in checks:
         if ok:
             display.ok(f"{name}: {detail}")
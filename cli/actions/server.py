@@ -5,8 +5,8 @@ import socket
 import threading
 import webbrowser
 from pathlib import Path
+from typing import Optional
 
-from server.serve import serve
 from settings import get_settings
 from utils.display_utils import display
 
@@ -25,29 +25,44 @@ def show_database_status() -> None:
     print("Database functionality is currently disabled in the CLI-focused MVP.")
 
 
-def launch_web_app(host: str = get_settings().host, port: int = get_settings().port) -> None:
-    """Launch the web interface, starting the server if needed."""
+def launch_web_app(host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """Launch the web interface, starting the server if needed.
+
+    ``host``/``port`` default to the configured settings, read at call time.
+    """
+    s = get_settings()
+    host = s.host if host is None else host
+    port = s.port if port is None else port
     logger.info("launch_web_app", extra={"host": host, "port": port})
 
     def _port_open() -> bool:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # Bound the probe so a filtered port cannot stall the menu on the
+            # OS connect timeout; same budget as server.serve._wait_for_port.
+            sock.settimeout(0.25)
             try:
-                sock.connect((host, port))
-                return True
+                return sock.connect_ex((host, port)) == 0
             except OSError:
                 return False
 
     if not _port_open():
+        from server.serve import serve
+
         threading.Thread(
             target=serve,
             kwargs={"host": host, "port": port, "open_browser": True},
             daemon=True,
         ).start()
     else:
-        webbrowser.open(f"http://{host}:{port}")
+        # xdg-open and friends can take a while to return; don't hold the menu.
+        threading.Thread(
+            target=webbrowser.open, args=(f"http://{host}:{port}",), daemon=True
+        ).start()
 
 
-def run_server(host: str = get_settings().host, port: int = get_settings().port) -> None:
+def run_server(host: Optional[str] = None, port: Optional[int] = None) -> None:
     """Start the API server using centralized config."""
+    from server.serve import serve
+
     with _action_context("run_server"):
         serve(host=host, port=port, open_browser=False)
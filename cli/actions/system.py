@@ -1,42 +1,96 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List
+
 from utils.display_utils import display
-from core.diagnostics import BinaryCheck, ModuleCheck, SystemDoctor
+from core.diagnostics import BinaryCheck, CheckResult, ModuleCheck, SystemDoctor
+
+_BINARIES = ["adb", "aapt2", "apktool", "jadx", "yara", "java"]
+_MODULES = ["androguard", "fastapi", "uvicorn", "sqlalchemy", "mysql.connector"]
+
+# Module checks import each package, which dominates doctor run time.  Successful
+# results are persisted between CLI invocations; binary lookups are cheap
+# ``shutil.which`` calls and always run.
+_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "rotterdam" / "doctor.json"
+)
+_CACHE_TTL = 3600.0
+
+
+def _module_cache_key() -> str:
+    """Fingerprint the interpreter and import path; installs touch these mtimes."""
+    parts = [sys.executable, sys.version]
+    for entry in sys.path:
+        try:
+            parts.append(f"{entry}:{os.stat(entry or '.').st_mtime_ns}")
+        except OSError:
+            continue
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _load_cached_modules(key: str) -> Dict[str, CheckResult]:
+    try:
+        data = json.loads(_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("key") != key or time.time() - data.get("created", 0) > _CACHE_TTL:
+        return {}
+    try:
+        return {r["name"]: CheckResult(**r) for r in data.get("modules", [])}
+    except (TypeError, KeyError):
+        return {}
+
+
+def _store_cached_modules(key: str, results: List[CheckResult]) -> None:
+    payload = {"key": key, "created": time.time(), "modules": [asdict(r) for r in results]}
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, _CACHE_PATH)
+    except OSError:
+        pass
 
 
 def run_doctor() -> None:
     """Check availability of required binaries and Python modules."""
+    key = _module_cache_key()
+    cached = _load_cached_modules(key)
     checks = [
-        *(BinaryCheck(b) for b in ["adb", "aapt2", "apktool", "jadx", "yara", "java"]),
-        *(
-            ModuleCheck(m)
-            for m in [
-                "androguard",
-                "fastapi",
-                "uvicorn",
-                "sqlalchemy",
-                "mysql.connector",
-            ]
-        ),
+        *(BinaryCheck(b) for b in _BINARIES),
+        *(ModuleCheck(m) for m in _MODULES if m not in cached),
     ]
 
     doctor = SystemDoctor(checks)
-    results = doctor.run()
+    fresh = {r.name: r for r in doctor.run()}
+
+    passed = [r for r in fresh.values() if r.category == "module" and r.ok]
+    if passed:
+        _store_cached_modules(key, [*cached.values(), *passed])
+
+    binaries = [fresh[b] for b in _BINARIES]
+    modules = [cached.get(m) or fresh[m] for m in _MODULES]
 
     display.print_section("Binary Dependencies")
-    for res in (r for r in results if r.category == "binary"):
+    for res in binaries:
         if res.ok:
             display.ok(f"{res.name} : {res.detail}")
         else:
             display.fail(f"{res.name} : {res.detail}")
 
     display.print_section("Python Modules")
-    for res in (r for r in results if r.category == "module"):
+    for res in modules:
         if res.ok:
             display.ok(f"{res.name} : {res.detail}")
         else:
             display.fail(f"{res.name} : {res.detail}")
 
-    if doctor.has_issues:
+    if any(r.flag for r in (*binaries, *modules)):
         display.warn("One or more diagnostics failed. Review the flags above.")
-
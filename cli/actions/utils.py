@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 
+from core.tools.adb import shell_session
 from utils.logging_utils.app_logger import app_logger
 
 logger = app_logger.get_logger(__name__)
@@ -15,6 +16,14 @@ def action_context(
     device_serial: str | None = None,
     apk_path: str | None = None,
 ):
-    """Wrapper around :func:`log_context` to reduce repetition in actions."""
-    with log_context(action=action, device_serial=device_serial, apk_path=apk_path):
+    """Wrapper around :func:`log_context` to reduce repetition in actions.
+
+    Device actions also share a persistent ``adb shell`` for ``device_serial``.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(
+            log_context(action=action, device_serial=device_serial, apk_path=apk_path)
+        )
+        if device_serial:
+            stack.enter_context(shell_session(device_serial))
         yield
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any, Dict, Optional
 
 from app_config import app_config
@@ -11,15 +12,27 @@ from utils.display_utils import display
 from . import actions
 
 
+# The device menu re-checks the device before and after every prompt; reuse a
+# recent ``adb get-state`` answer instead of spawning adb for each check.
+_ONLINE_TTL = 2.0
+_online_cache: Dict[str, tuple[float, bool]] = {}
+
+
 def device_online(serial: str) -> bool:
     """Return True if the device is online according to ``adb get-state``."""
     if not serial:
         return False
+    now = time.monotonic()
+    cached = _online_cache.get(serial)
+    if cached is not None and now - cached[0] < _ONLINE_TTL:
+        return cached[1]
     try:
         proc = adb._run_adb(["-s", serial, "get-state"])
+        online = (proc.stdout or "").strip() == "device"
     except Exception:
-        return False
-    return (proc.stdout or "").strip() == "device"
+        online = False
+    _online_cache[serial] = (now, online)
+    return online
 
 
 def run_device_menu(serial: str, *, json_mode: bool = False) -> Optional[str | Dict[str, Any]]:
@@ -137,6 +150,7 @@ def run_main_menu(*, json_mode: bool = False) -> Optional[Dict[str, Any]]:
             actions.show_detailed_devices()
         elif num == 3:
             actions.scan_for_devices()
+            _online_cache.clear()
         elif num == 4:
             device = selection.list_and_select_device()
             if device:
@@ -9,11 +9,28 @@ additional checks can be added in the future.
 
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Optional
 import importlib
+import os
 from shutil import which
 
 
+@lru_cache(maxsize=64)
+def _which_on(name: str, search_path: str) -> Optional[str]:
+    return which(name, path=search_path)
+
+
+def cached_which(name: str) -> Optional[str]:
+    """``shutil.which`` memoised per command and current ``$PATH``.
+
+    Repeat doctor/health runs in one session skip the per-directory stats,
+    while a changed ``$PATH`` still gets a fresh lookup.
+    """
+    return _which_on(name, os.environ.get("PATH", os.defpath))
+
+
 @dataclass
 class CheckResult:
     """Result of a single diagnostic check."""
@@ -50,7 +67,7 @@ class BinaryCheck(BaseCheck):
         self.name = command
 
     def run(self) -> CheckResult:  # pragma: no cover - wrapper over shutil.which
-        path = which(self.name)
+        path = cached_which(self.name)
         if path:
             return CheckResult(self.category, self.name, True, path)
         return CheckResult(self.category, self.name, False, "not found")
@@ -81,8 +98,16 @@ class SystemDoctor:
         self.results: List[CheckResult] = []
 
     def run(self) -> List[CheckResult]:
-        """Run all registered checks and return their results."""
-        self.results = [chk.run() for chk in self.checks]
+        """Run all registered checks and return their results.
+
+        Checks are independent and mostly wait on the filesystem or imports,
+        so they run concurrently; results keep the registration order.
+        """
+        if not self.checks:
+            self.results = []
+            return self.results
+        with ThreadPoolExecutor(max_workers=len(self.checks)) as ex:
+            self.results = list(ex.map(lambda chk: chk.run(), self.checks))
         return self.results
 
     @property
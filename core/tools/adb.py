@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import queue
 import subprocess
-from typing import List
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from settings import get_settings
 
@@ -11,8 +18,155 @@ def adb_path() -> str:
     return get_settings().adb_bin
 
 
+class ShellSession:
+    """A long-lived ``adb -s <serial> shell`` fed commands over stdin.
+
+    Each command is followed by an ``echo`` of a unique marker and the exit
+    status, and output is read back up to that marker.  This avoids paying
+    adb's process start-up and device handshake for every shell command.
+    """
+
+    def __init__(self, serial: str) -> None:
+        self.serial = serial
+        self._lock = threading.Lock()
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        # ``-T``: no PTY, so the device shell does not echo our input back.
+        self._proc = subprocess.Popen(
+            [adb_path(), "-s", serial, "shell", "-T"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self) -> None:
+        assert self._proc.stdout is not None
+        try:
+            for line in self._proc.stdout:
+                self._lines.put(line)
+        finally:
+            # Always wake a waiting ``run`` rather than leaving it to time out.
+            self._lines.put(None)
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def run(self, command: str, *, timeout: float) -> Tuple[int, str]:
+        """Run ``command`` and return ``(exit_status, stdout)``."""
+        token = uuid.uuid4().hex
+        marker = f"__rotterdam_{token}__"
+        # The quotes split the marker in the text we send, so a shell that
+        # echoes its input (PTY, ``set -v``/``-x``) cannot produce a false match.
+        # Commands get /dev/null as stdin so they cannot consume what follows.
+        script = f'{{ {command}\n}} </dev/null\necho "__rotterdam_""{token}__ $?"\n'
+        with self._lock:
+            assert self._proc.stdin is not None
+            try:
+                self._proc.stdin.write(script)
+                self._proc.stdin.flush()
+            except OSError as exc:
+                self.close()
+                raise RuntimeError("adb shell session closed") from exc
+
+            out: List[str] = []
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = self._lines.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    # Output is now out of step with our markers; drop the session.
+                    self.close()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                if line is None:
+                    self.close()
+                    raise RuntimeError("adb shell session closed")
+                idx = line.find(marker)
+                if idx == -1:
+                    out.append(line)
+                    continue
+                # Output without a trailing newline shares a line with the marker.
+                out.append(line[:idx])
+                status = line[idx + len(marker) :].strip()
+                if not status.isdigit():
+                    # Output is no longer framed as expected; never reuse it.
+                    self.close()
+                    raise RuntimeError("adb shell session out of sync")
+                return int(status), "".join(out)
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            try:
+                if self._proc.stdin is not None:
+                    self._proc.stdin.close()
+                self._proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+
+
+_sessions: Dict[str, ShellSession] = {}
+_sessions_lock = threading.Lock()
+_active_serials: ContextVar[frozenset[str]] = ContextVar("adb_shell_sessions", default=frozenset())
+
+
+def _session_for(serial: str) -> ShellSession:
+    with _sessions_lock:
+        session = _sessions.get(serial)
+        if session is None or not session.alive:
+            session = ShellSession(serial)
+            _sessions[serial] = session
+        return session
+
+
+@atexit.register
+def close_sessions() -> None:
+    """Terminate every persistent shell session."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+@contextmanager
+def shell_session(serial: str) -> Iterator[None]:
+    """Route ``adb -s <serial> shell ...`` calls through a persistent session.
+
+    The session is started on first use and kept for the rest of the process,
+    so consecutive actions against the same device share one ``adb shell``.
+    """
+    token = _active_serials.set(_active_serials.get() | {serial})
+    try:
+        yield
+    finally:
+        _active_serials.reset(token)
+
+
+def _routed_shell(args: List[str]) -> Optional[str]:
+    """Return the shell command for ``args`` if a session should handle it."""
+    if len(args) > 3 and args[0] == "-s" and args[2] == "shell":
+        if args[1] in _active_serials.get():
+            return " ".join(args[3:])
+    return None
+
+
 def run(args: List[str], *, timeout: int = 8) -> subprocess.CompletedProcess:
     """Run adb with robust defaults and return the completed process."""
+    command = _routed_shell(args)
+    if command is not None:
+        try:
+            session = _session_for(args[1])
+        except OSError:
+            session = None  # fall back to a one-off adb process below
+        if session is not None:
+            status, stdout = session.run(command, timeout=timeout)
+            if status != 0:
+                raise RuntimeError(f"adb failed with code {status}")
+            return subprocess.CompletedProcess([adb_path(), *args], 0, stdout=stdout, stderr="")
+
     cmd = [adb_path(), *args]
     try:
         return subprocess.run(
@@ -24,4 +178,4 @@ def run(args: List[str], *, timeout: int = 8) -> subprocess.CompletedProcess:
         raise RuntimeError(f"adb failed with code {exc.returncode}") from exc
 
 
-__all__ = ["run", "adb_path"]
+__all__ = ["run", "adb_path", "shell_session", "close_sessions", "ShellSession"]
@@ -53,19 +53,23 @@ class SingleConnection:
 
     def ping(self) -> bool:
         try:
-            if not self._conn:
-                self.connect()
-            if self._conn is not None:
-                self._conn.ping(reconnect=True, attempts=1, delay=0)  # type: ignore[attr-defined]
+            self._checkout()
             return True
         except Error:
             self.disconnect()
             return False
 
+    def _checkout(self) -> None:
+        # One round trip either way: a new connection has just completed its
+        # handshake, an existing one is pre-pinged (and reconnected if stale).
+        if not self._conn:
+            self.connect()
+        else:
+            self._conn.ping(reconnect=True, attempts=1, delay=0)  # type: ignore[attr-defined]
+
     @contextmanager
     def connection(self) -> Iterator[Any]:
-        self.connect()
-        self.ping()
+        self._checkout()
         assert self._conn is not None
         yield self._conn
 
@@ -128,8 +132,12 @@ class DatabaseCore:
         self._provider = provider
 
     @staticmethod
-    def from_config(use_pool: bool = False, **kwargs) -> "DatabaseCore":
+    def from_config(
+        use_pool: bool = False, connect_timeout: Optional[int] = None, **kwargs
+    ) -> "DatabaseCore":
         cfg = dict(DB_CONFIG)
+        if connect_timeout is not None:
+            cfg["connection_timeout"] = connect_timeout
         provider = (
             ConnectionPool(cfg, **kwargs)
             if use_pool else
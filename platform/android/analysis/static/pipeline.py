@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from app_config import app_config
 from utils.display_utils import display
@@ -54,11 +54,29 @@ except Exception:  # pragma: no cover
 from utils.reporting_utils import generate_report
 
 
+class StaticAnalysisResult(NamedTuple):
+    """Output directory plus the manifest data shown right after an analysis."""
+
+    outdir: Path
+    components: Dict[str, List[Dict[str, Any]]]
+    features: List[Dict[str, Any]]
+    report: Dict[str, Any]
+
+
 def analyze_apk(apk_path: str, outdir: str | Path | None = None) -> Path:
     """Decompile an APK and run simple static analysis.
 
     Returns the output directory used for analysis.
     """
+    return run_static_analysis(apk_path, outdir).outdir
+
+
+def run_static_analysis(apk_path: str, outdir: str | Path | None = None) -> StaticAnalysisResult:
+    """Run :func:`analyze_apk` and also return the in-memory results.
+
+    Callers that display the components, features and report straight away
+    can use these instead of re-reading the JSON files just written.
+    """
     apk = Path(apk_path)
     out = Path(outdir) if outdir else app_config.OUTPUT_DIR / app_config.ts()
     out.mkdir(parents=True, exist_ok=True)
@@ -249,7 +267,7 @@ def analyze_apk(apk_path: str, outdir: str | Path | None = None) -> Path:
         (out / "snapshot_diff.json").write_text(json.dumps(diff, indent=2))
 
     # Final consolidated report (supports both yara_matches and diff)
-    write_report(
+    report = write_report(
         out,
         perms,
         perm_details,
@@ -266,4 +284,4 @@ def analyze_apk(apk_path: str, outdir: str | Path | None = None) -> Path:
         findings,
     )
 
-    return out
+    return StaticAnalysisResult(out, components, features, report)
@@ -133,9 +133,8 @@ def write_report(
     yara_matches: Dict[str, List[str]] | None = None,
     diff: Dict[str, Any] | None = None,
     findings: List[Dict[str, Any]] | None = None,
-) -> Path:
-    """Write a JSON report containing analysis results."""
-    report_path = out / "report.json"
+) -> Dict[str, Any]:
+    """Write ``out/report.json`` with the analysis results and return its data."""
     all_metrics: Dict[str, Any] = {**(metrics or {}), **(dynamic_metrics or {})}
 
     data: Dict[str, Any] = {
@@ -156,5 +155,5 @@ def write_report(
     if findings is not None:
         data["findings"] = findings
 
-    report_path.write_text(json.dumps(data, indent=2))
-    return report_path
+    (out / "report.json").write_text(json.dumps(data, indent=2))
+    return data
@@ -4,6 +4,6 @@
 
 from __future__ import annotations
 
-from core.tools.adb import adb_path as _adb_path, run as _run_adb
+from core.tools.adb import adb_path as _adb_path, run as _run_adb, shell_session
 
-__all__ = ["_run_adb", "_adb_path"]
+__all__ = ["_run_adb", "_adb_path", "shell_session"]
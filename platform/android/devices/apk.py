@@ -13,18 +13,28 @@ from typing import Dict
 from .adb import _run_adb
 
 
-def pull_apk(serial: str, package: str, dest_dir: str = "output/apks") -> Path:
-    """Pull the APK for ``package`` from the device ``serial``.
-
-    Returns the local file path of the pulled APK.
-    """
+def _remote_apk_path(serial: str, package: str) -> str:
     proc = _run_adb(["-s", serial, "shell", "pm", "path", package], timeout=10)
-    remote = ""
     for line in (proc.stdout or "").splitlines():
         line = line.strip()
         if line.startswith("package:"):
-            remote = line.split(":", 1)[1]
-            break
+            return line.split(":", 1)[1]
+    return ""
+
+
+def pull_apk(
+    serial: str,
+    package: str,
+    dest_dir: str = "output/apks",
+    remote_path: str | None = None,
+) -> Path:
+    """Pull the APK for ``package`` from the device ``serial``.
+
+    ``remote_path`` may be supplied when the on-device APK path is already
+    known (e.g. from ``pm list packages -f``) to skip the ``pm path`` query.
+    Returns the local file path of the pulled APK.
+    """
+    remote = remote_path or _remote_apk_path(serial, package)
     if not remote:
         raise RuntimeError(f"Package {package} not found on device")
 
@@ -40,6 +50,7 @@ def acquire_apk(
     package: str,
     dest_dir: str = "output/apks",
     operator: str | None = None,
+    remote_path: str | None = None,
 ) -> Dict[str, str]:
     """Pull an APK and record chain-of-custody metadata.
 
@@ -47,7 +58,7 @@ def acquire_apk(
     and source device/package identifiers.
     """
 
-    path = pull_apk(serial, package, dest_dir=dest_dir)
+    path = pull_apk(serial, package, dest_dir=dest_dir, remote_path=remote_path)
     sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
     timestamp = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
     if operator is None:
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import subprocess
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from .adb import _run_adb
 from .props import (
@@ -54,7 +54,7 @@ def check_connected_devices() -> str:
             raise RuntimeError(f"Error running adb: {e}") from e
 
     output = (result.stdout or "").strip()
-    if not parse_devices_l(output):
+    if next(iter_devices_l(output), None) is None:
         print("No Android devices detected.")
         print("Fedora users may need a udev rule such as:")
         print('  SUBSYSTEM=="usb", ATTR{idVendor}=="18d1", MODE="0666", GROUP="plugdev"')
@@ -69,19 +69,15 @@ def check_connected_devices() -> str:
 # Parse `adb devices -l` output
 # -----------------------------
 
-def parse_devices_l(output: str) -> List[Dict[str, str]]:
-    """Parse `adb devices -l` into a list of dicts."""
-    lines = [ln.strip() for ln in (output or "").splitlines() if ln.strip()]
-    if not lines:
-        logger.info("no devices in adb output")
-        return []
-    if lines[0].lower().startswith("list of devices"):
-        lines = lines[1:]
+def iter_devices_l(output: str) -> Iterator[Dict[str, str]]:
+    """Yield one dict per device line of `adb devices -l` output.
 
-    devices: List[Dict[str, str]] = []
-    for ln in lines:
+    Lines are parsed as they are reached, so callers that only need to know
+    whether any device is attached stop after the first one.
+    """
+    for ln in (output or "").splitlines():
         parts = ln.split()
-        if not parts:
+        if not parts or ln.lower().lstrip().startswith("list of devices"):
             continue
         serial = parts[0]
         state = parts[1] if len(parts) > 1 else "unknown"
@@ -90,7 +86,15 @@ def parse_devices_l(output: str) -> List[Dict[str, str]]:
             if ":" in p:
                 k, v = p.split(":", 1)
                 meta[k] = v
-        devices.append({"serial": serial, "state": state, **meta})
+        yield {"serial": serial, "state": state, **meta}
+
+
+def parse_devices_l(output: str) -> List[Dict[str, str]]:
+    """Parse `adb devices -l` into a list of dicts."""
+    devices = list(iter_devices_l(output))
+    if not devices:
+        logger.info("no devices in adb output")
+        return []
     logger.info("parsed %d devices", len(devices))
     return devices
 
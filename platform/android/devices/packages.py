@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
+import shlex
 import subprocess
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 from .adb import _run_adb
 
@@ -64,23 +65,77 @@ def list_installed_packages(serial: str) -> List[str]:
     except subprocess.CalledProcessError as exc:
         raise RuntimeError(f"Failed to list packages on device {serial}: {exc}") from exc
 
+    out = proc.stdout
+    if not out:
+        return []
     packages: List[str] = []
-    for line in (proc.stdout or "").splitlines():
+    for line in out.splitlines():
         line = line.strip()
         if line.startswith("package:"):
             packages.append(line.split(":", 1)[1])
     return packages
 
 
-def _get_permissions(serial: str, package: str) -> List[str]:
-    """Return permissions declared by the package."""
+def _split_package_entry(entry: str) -> Tuple[str, str]:
+    """Split a ``pm list packages -f`` entry into ``(apk_path, package)``."""
+    if "=" not in entry:
+        return "", entry
+    # Newer install paths contain "==", so split on the last "=".
+    path, pkg = entry.rsplit("=", 1)
+    return path, pkg
+
+
+def list_installed_package_paths(serial: str) -> Dict[str, str]:
+    """Return a mapping of installed package name to its base APK path.
+
+    One ``pm list packages -f`` call yields both, so callers that go on to
+    pull an APK can skip a separate ``pm path`` lookup.
+    """
     try:
-        proc = _run_adb(["-s", serial, "shell", "dumpsys", "package", package], timeout=10)
-    except subprocess.CalledProcessError:
-        return []
+        proc = _run_adb(["-s", serial, "shell", "pm", "list", "packages", "-f"], timeout=10)
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(f"Failed to list packages on device {serial}: {exc}") from exc
+
+    out = proc.stdout
+    if not out:
+        return {}
+    paths: Dict[str, str] = {}
+    for line in out.splitlines():
+        line = line.strip()
+        if line.startswith("package:") and "=" in line:
+            path, pkg = _split_package_entry(line[len("package:") :])
+            paths[pkg] = path
+    return paths
+
+
+# ``dumpsys package`` is queried for many packages at once through a single
+# ``adb shell`` invocation, with a sentinel line between each package's output.
+# Chunking keeps the command line well under old adbd length limits.
+_DUMPSYS_BATCH = 40
+_BATCH_SENTINEL = "__rotterdam_batch_end__"
+
 
+def _dumpsys_packages(serial: str, packages: List[str]) -> Dict[str, str]:
+    """Return ``dumpsys package`` output keyed by package name."""
+    outputs: Dict[str, str] = {}
+    for start in range(0, len(packages), _DUMPSYS_BATCH):
+        chunk = packages[start : start + _DUMPSYS_BATCH]
+        script = "; ".join(
+            f"dumpsys package {shlex.quote(pkg)}; echo {_BATCH_SENTINEL}" for pkg in chunk
+        )
+        try:
+            proc = _run_adb(["-s", serial, "shell", script], timeout=10 * len(chunk))
+        except subprocess.CalledProcessError:
+            continue
+        sections = (proc.stdout or "").split(_BATCH_SENTINEL)
+        outputs.update(zip(chunk, sections))
+    return outputs
+
+
+def _parse_permissions(dump: str) -> List[str]:
+    """Return permissions listed in ``dumpsys package`` output."""
     perms: List[str] = []
-    for line in (proc.stdout or "").splitlines():
+    for line in dump.splitlines():
         line = line.strip()
         if line.startswith("uses-permission:"):
             perm = line.split(":", 1)[1].strip()
@@ -107,8 +162,9 @@ def scan_for_dangerous_permissions(serial: str) -> List[Dict[str, Any]]:
 
     results: List[Dict[str, Any]] = []
     packages = list_installed_packages(serial)
+    dumps = _dumpsys_packages(serial, packages)
     for pkg in packages:
-        perms = _get_permissions(serial, pkg)
+        perms = _parse_permissions(dumps.get(pkg, ""))
         risky = sorted(p for p in perms if p in DANGEROUS_PERMISSIONS)
         if risky:
             categories = _categorize_package(pkg)
@@ -154,12 +210,7 @@ def inventory_packages(serial: str) -> List[Dict[str, Any]]:
             pkg_part, installer = line.split(" installer=", 1)
         else:
             pkg_part = line
-        path = ""
-        pkg = ""
-        if "=" in pkg_part:
-            path, pkg = pkg_part.split("=", 1)
-        else:
-            pkg = pkg_part
+        path, pkg = _split_package_entry(pkg_part)
         system_app = bool(path) and not path.startswith("/data/")
         priv_app = "/priv-app/" in path
         info: Dict[str, Any] = {
@@ -177,36 +228,35 @@ def inventory_packages(serial: str) -> List[Dict[str, Any]]:
             "categories": _categorize_package(pkg),
         }
 
-        # Fetch version details and additional metadata
-        try:
-            dump = _run_adb(["-s", serial, "shell", "dumpsys", "package", pkg], timeout=10)
-            for ln in (dump.stdout or "").splitlines():
-                ln = ln.strip()
-                if ln.startswith("versionName="):
-                    info["version_name"] = ln.split("=", 1)[1]
-                elif ln.startswith("versionCode="):
-                    info["version_code"] = ln.split("=", 1)[1].split()[0]
-                elif ln.startswith("userId=") or ln.startswith("uid="):
-                    info["uid"] = ln.split("=", 1)[1].split()[0]
-                elif ln.startswith("pkgFlags=") or ln.startswith("flags="):
-                    flags = ln.split("[", 1)[-1].split("]", 1)[0].replace(",", " ")
-                    if "SYSTEM" in flags:
-                        info["system"] = True
-                    if "PRIVILEGED" in flags:
-                        info["priv"] = True
-                elif ln.startswith("uses-permission:"):
-                    perm = ln.split(":", 1)[1].strip()
-                    if perm:
-                        info.setdefault("permissions", []).append(perm)
-                        if perm in DANGEROUS_PERMISSIONS:
-                            info["dangerous_permissions"].append(perm)
-            # Calculate risk score once permissions gathered
-            info["risk_score"] = len(info["dangerous_permissions"]) + (
-                1 if info["high_value"] else 0
-            )
-        except subprocess.CalledProcessError:
-            pass
-
         packages.append(info)
 
+    # Fetch version details and additional metadata
+    dumps = _dumpsys_packages(serial, [info["package"] for info in packages])
+    for info in packages:
+        dump = dumps.get(info["package"])
+        if dump is None:
+            continue
+        for ln in dump.splitlines():
+            ln = ln.strip()
+            if ln.startswith("versionName="):
+                info["version_name"] = ln.split("=", 1)[1]
+            elif ln.startswith("versionCode="):
+                info["version_code"] = ln.split("=", 1)[1].split()[0]
+            elif ln.startswith("userId=") or ln.startswith("uid="):
+                info["uid"] = ln.split("=", 1)[1].split()[0]
+            elif ln.startswith("pkgFlags=") or ln.startswith("flags="):
+                flags = ln.split("[", 1)[-1].split("]", 1)[0].replace(",", " ")
+                if "SYSTEM" in flags:
+                    info["system"] = True
+                if "PRIVILEGED" in flags:
+                    info["priv"] = True
+            elif ln.startswith("uses-permission:"):
+                perm = ln.split(":", 1)[1].strip()
+                if perm:
+                    info.setdefault("permissions", []).append(perm)
+                    if perm in DANGEROUS_PERMISSIONS:
+                        info["dangerous_permissions"].append(perm)
+        # Calculate risk score once permissions gathered
+        info["risk_score"] = len(info["dangerous_permissions"]) + (1 if info["high_value"] else 0)
+
     return packages
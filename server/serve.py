@@ -10,8 +10,6 @@ import webbrowser
 from pathlib import Path
 from typing import Optional
 
-import uvicorn
-
 from settings import get_settings
 
 _ROOT = Path(__file__).resolve().parents[1]
@@ -21,13 +19,15 @@ if str(_ROOT) not in sys.path:
 
 def _wait_for_port(host: str, port: int, timeout: float = 5.0) -> bool:
     """Return True once TCP connect succeeds before timeout."""
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    # A local uvicorn is usually listening within ~100 ms; poll tightly so the
+    # browser opens as soon as it is, rather than on a coarse retry boundary.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
             with socket.create_connection((host, port), timeout=0.25):
                 return True
         except OSError:
-            time.sleep(0.1)
+            time.sleep(0.02)
     return False
 
 
@@ -83,6 +83,10 @@ def serve(
 
     _validate_host_port(h, p)
 
+    # Deferred so importing this module (and validating arguments) does not
+    # pull in uvicorn and its server stack.
+    import uvicorn
+
     config = uvicorn.Config(
         "server.main:app",
         host=h,
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.modules.pop("platform", None)
+
+from core.tools import adb
+
+
+@pytest.fixture
+def fake_adb(monkeypatch, tmp_path: Path):
+    # Stand-in for adb: drop "-s <serial>", then behave like "adb shell [-T] [cmd]".
+    # FAKE_SH_FLAGS lets a test make the interactive shell echo its input.
+    script = tmp_path / "adb"
+    script.write_text(
+        "#!/bin/sh\n"
+        "shift 3\n"
+        'if [ "$1" = -T ]; then shift; fi\n'
+        'if [ $# -eq 0 ]; then exec sh $FAKE_SH_FLAGS 2>&1; fi\n'
+        'exec sh -c "$*"\n'
+    )
+    script.chmod(0o755)
+    monkeypatch.setattr(adb, "adb_path", lambda: str(script))
+    monkeypatch.setattr(adb, "_sessions", {})
+    yield
+    adb.close_sessions()
+
+
+def test_shell_session_reuses_one_shell(fake_adb):
+    with adb.shell_session("serial123"):
+        first = adb.run(["-s", "serial123", "shell", "echo", "$$"]).stdout
+        second = adb.run(["-s", "serial123", "shell", "echo", "$$"]).stdout
+        partial = adb.run(["-s", "serial123", "shell", "printf", "abc"]).stdout
+        with pytest.raises(RuntimeError):
+            adb.run(["-s", "serial123", "shell", "false"])
+        after_error = adb.run(["-s", "serial123", "shell", "echo", "$$"]).stdout
+
+    outside = adb.run(["-s", "serial123", "shell", "echo", "$$"]).stdout
+
+    assert first.strip().isdigit()
+    assert first == second == after_error
+    assert partial == "abc"
+    assert outside != first
+
+
+def test_shell_session_ignores_echoed_input(fake_adb, monkeypatch):
+    monkeypatch.setenv("FAKE_SH_FLAGS", "-v")
+    with adb.shell_session("serial123"):
+        first = adb.run(["-s", "serial123", "shell", "echo", "hello"]).stdout
+        second = adb.run(["-s", "serial123", "shell", "echo", "world"]).stdout
+
+    # Echoed lines are part of the output, but each call sees its own status
+    # and result rather than the previous command's.
+    assert "hello\n" in first and "world" not in first
+    assert "world\n" in second and "hello" not in second
+
+
+def test_shell_session_command_cannot_read_session_stdin(fake_adb):
+    with adb.shell_session("serial123"):
+        assert adb.run(["-s", "serial123", "shell", "cat"], timeout=2).stdout == ""
+        assert adb.run(["-s", "serial123", "shell", "echo", "next"]).stdout == "next\n"
+
+
+def test_shell_session_replaces_undecodable_output(fake_adb):
+    with adb.shell_session("serial123"):
+        out = adb.run(["-s", "serial123", "shell", "printf", "'a\\377b\\n'"], timeout=5).stdout
+        after = adb.run(["-s", "serial123", "shell", "echo", "next"], timeout=5).stdout
+
+    assert out == "a\ufffdb\n"
+    assert after == "next\n"
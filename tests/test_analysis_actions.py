@@ -0,0 +1,161 @@
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.modules.pop("platform", None)
+
+from cli.actions import analysis
+from cli.actions.analysis import _display_manifest_insights
+
+
+def test_display_manifest_insights_renders_tables(tmp_path: Path, capsys):
+    (tmp_path / "components.json").write_text(
+        json.dumps(
+            {
+                "activity": [{"name": "com.example.Main", "exported": True}],
+                "service": [],
+                "provider": [{"name": "com.example.Files", "permission": "p.READ"}],
+            }
+        )
+    )
+    (tmp_path / "features.json").write_text(
+        json.dumps([{"name": "android.hardware.camera", "required": True}])
+    )
+    (tmp_path / "report.json").write_text(
+        json.dumps(
+            {
+                "metrics": {"permission_count": 3, "permission_prefix_counts": {"android": 2}},
+                "diff": {"added_permissions": ["android.permission.CAMERA"]},
+            }
+        )
+    )
+
+    _display_manifest_insights(tmp_path)
+    out = capsys.readouterr().out
+
+    assert "android.hardware.camera" in out
+    assert "Activities" in out and "com.example.Main" in out
+    assert "Services" not in out
+    assert "Providers" in out and "p.READ" in out
+    assert "permission_count" in out
+    assert "Permission Patterns" in out
+    assert "Added permissions: android.permission.CAMERA" in out
+
+
+def test_display_manifest_insights_tolerates_missing_files(tmp_path: Path, capsys):
+    _display_manifest_insights(tmp_path)
+    assert capsys.readouterr().out == ""
+
+
+def test_display_manifest_insights_rereads_changed_report(tmp_path: Path, capsys):
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps({"metrics": {"permission_count": 1}}))
+    _display_manifest_insights(tmp_path)
+    assert "permission_count" in capsys.readouterr().out
+
+    report.write_text(json.dumps({"metrics": {"receiver_count": 2}}))
+    stat = report.stat()
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    _display_manifest_insights(tmp_path)
+    out = capsys.readouterr().out
+    assert "receiver_count" in out and "permission_count" not in out
+
+
+def test_installed_package_paths_reused_between_menu_visits(monkeypatch):
+    calls = []
+
+    def fake_listing(serial):
+        calls.append(serial)
+        return {"com.example": "/data/app/base.apk"}
+
+    monkeypatch.setattr(analysis.packages, "list_installed_package_paths", fake_listing)
+    monkeypatch.setattr(analysis, "_package_paths_cache", {})
+
+    assert analysis._installed_package_paths("SER") == {"com.example": "/data/app/base.apk"}
+    analysis._installed_package_paths("SER")
+    assert calls == ["SER"]
+
+    analysis._package_paths_cache.pop("SER")
+    analysis._installed_package_paths("SER")
+    assert calls == ["SER", "SER"]
+
+
+def test_print_diff_lists_permission_and_component_changes(capsys):
+    analysis._print_diff(
+        {
+            "added_permissions": ["a.CAMERA", "a.MIC"],
+            "removed_permissions": [],
+            "added_components": {"activity": ["com.example.New"], "service": []},
+            "removed_components": {"receiver": ["com.example.Boot"]},
+        }
+    )
+    assert capsys.readouterr().out.splitlines() == [
+        "Added permissions: a.CAMERA, a.MIC",
+        "Added Activities: com.example.New",
+        "Removed Receivers: com.example.Boot",
+    ]
+
+
+def test_display_manifest_insights_uses_supplied_bundle(tmp_path: Path, monkeypatch, capsys):
+    def fail_load(outdir):
+        raise AssertionError("artifacts should not be read")
+
+    monkeypatch.setattr(analysis, "_load_manifest_bundle", fail_load)
+    bundle = ({"service": [{"name": "com.example.Sync"}]}, [], {"metrics": {"score": 7}})
+
+    _display_manifest_insights(tmp_path, bundle)
+    out = capsys.readouterr().out
+    assert "com.example.Sync" in out and "score" in out
+
+
+def _write_large_report(path: Path) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "permissions": [f"p.{i}" for i in range(50)],
+                "metrics": {"permission_count": 50, "ratio": 0.25},
+                "components": {"activity": [{"name": "com.example.Main"}]},
+                "diff": {"added_permissions": ["android.permission.CAMERA"]},
+                "findings": [],
+            }
+        )
+    )
+
+
+def _expected_sections(path: Path):
+    data = json.loads(path.read_text())
+    return {key: data[key] for key in ("metrics", "diff")}
+
+
+def test_load_report_streams_sections_with_stub_ijson(monkeypatch, tmp_path: Path):
+    report = tmp_path / "report.json"
+    _write_large_report(report)
+    seen = []
+
+    def kvitems(fh, prefix, use_float=False):
+        assert prefix == "" and use_float
+        for item in json.load(fh).items():
+            seen.append(item[0])
+            yield item
+
+    stub = types.SimpleNamespace(kvitems=kvitems, JSONError=ValueError)
+    monkeypatch.setattr(analysis, "ijson", stub)
+
+    assert analysis._load_report(str(report)) == _expected_sections(report)
+    # Iteration stops once both sections have been read.
+    assert seen == ["permissions", "metrics", "components", "diff"]
+
+
+def test_load_report_matches_json_load_with_ijson(monkeypatch, tmp_path: Path):
+    real = pytest.importorskip("ijson")
+    monkeypatch.setattr(analysis, "ijson", real)
+    report = tmp_path / "report.json"
+    _write_large_report(report)
+
+    assert analysis._load_report(str(report)) == _expected_sections(report)
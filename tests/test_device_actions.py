@@ -1,12 +1,22 @@
+import csv
+import json
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 sys.modules.pop("platform", None)
 
-from cli.actions.device import capture_screenshot
+from cli.actions import device
+from cli.actions.device import capture_screenshot, list_installed_packages
+
+
+@pytest.fixture(autouse=True)
+def _isolated_inventory(monkeypatch):
+    monkeypatch.setattr(device, "_inventory_cache", {})
 
 
 def test_capture_screenshot_creates_file(monkeypatch, tmp_path: Path):
@@ -28,3 +38,172 @@ def test_capture_screenshot_creates_file(monkeypatch, tmp_path: Path):
     capture_screenshot("serial123")
 
     assert (tmp_path / "shot.png").exists()
+
+
+def _pkg(name: str, **overrides):
+    info = {
+        "package": name,
+        "path": f"/data/app/{name}/base.apk",
+        "installer": "com.android.vending",
+        "version_name": "1.0",
+        "version_code": "1",
+        "high_value": False,
+        "uid": "10100",
+        "system": False,
+        "priv": False,
+        "dangerous_permissions": [],
+        "risk_score": 0,
+        "categories": [],
+    }
+    info.update(overrides)
+    return info
+
+
+def test_list_installed_packages_limit_keeps_sort_order(monkeypatch, tmp_path: Path):
+    inventory = [_pkg(f"com.example.app{i:02d}", system=i % 2 == 0) for i in range(20)]
+    inventory.append(_pkg("com.whatsapp", high_value=True))
+    monkeypatch.setattr("cli.actions.device.service.list_packages", lambda serial: list(inventory))
+
+    json_path = tmp_path / "pkgs.json"
+    list_installed_packages("serial123", json_path=str(json_path), limit=3)
+
+    names = [p["package"] for p in json.loads(json_path.read_text())]
+    assert names == ["com.whatsapp", "com.example.app01", "com.example.app03"]
+
+
+def test_list_installed_packages_combines_filters(monkeypatch, tmp_path: Path):
+    inventory = [
+        _pkg("com.whatsapp", high_value=True),
+        _pkg("com.facebook.orca", high_value=True),
+        _pkg("com.facebook.system", high_value=True, system=True),
+        _pkg("com.facebook.lite"),
+    ]
+    monkeypatch.setattr("cli.actions.device.service.list_packages", lambda serial: list(inventory))
+
+    json_path = tmp_path / "pkgs.json"
+    list_installed_packages(
+        "serial123", user=True, high_value=True, regex=r"^com\.facebook", json_path=str(json_path)
+    )
+
+    assert [p["package"] for p in json.loads(json_path.read_text())] == ["com.facebook.orca"]
+
+
+def test_list_installed_packages_writes_csv_and_json(monkeypatch, tmp_path: Path):
+    inventory = [
+        {
+            "package": "com.whatsapp",
+            "path": "/data/app/com.whatsapp/base.apk",
+            "installer": "com.android.vending",
+            "version_name": "2.0",
+            "version_code": "200",
+            "high_value": True,
+            "uid": "10100",
+            "system": False,
+            "priv": False,
+            "dangerous_permissions": ["android.permission.READ_SMS"],
+            "risk_score": 2,
+            "categories": ["Messaging"],
+        }
+    ]
+    monkeypatch.setattr("cli.actions.device.service.list_packages", lambda serial: inventory)
+
+    csv_path = tmp_path / "pkgs.csv"
+    json_path = tmp_path / "pkgs.json"
+    list_installed_packages("serial123", csv_path=str(csv_path), json_path=str(json_path))
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["package"] for r in rows] == ["com.whatsapp"]
+    assert json.loads(json_path.read_text()) == inventory
+
+
+def test_list_installed_packages_reuses_recent_inventory(monkeypatch, tmp_path: Path):
+    calls = []
+
+    def fake_list(serial):
+        calls.append(serial)
+        return [_pkg("com.whatsapp", high_value=True), _pkg("com.android.settings", system=True)]
+
+    monkeypatch.setattr("cli.actions.device.service.list_packages", fake_list)
+
+    user_json = tmp_path / "user.json"
+    system_json = tmp_path / "system.json"
+    list_installed_packages("serial123", user=True, json_path=str(user_json))
+    list_installed_packages("serial123", system=True, json_path=str(system_json))
+
+    assert calls == ["serial123"]
+    assert [p["package"] for p in json.loads(user_json.read_text())] == ["com.whatsapp"]
+    assert [p["package"] for p in json.loads(system_json.read_text())] == ["com.android.settings"]
+
+
+def test_inventory_cache_expires_and_stays_bounded(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(device.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(device.service, "list_packages", lambda serial: [_pkg(serial)])
+
+    for i in range(device._INVENTORY_MAX + 3):
+        device._inventory(f"serial{i}")
+    assert len(device._inventory_cache) == device._INVENTORY_MAX
+    assert "serial0" not in device._inventory_cache
+
+    clock[0] += device._INVENTORY_TTL
+    device._inventory("fresh")
+    assert list(device._inventory_cache) == ["fresh"]
+
+
+def test_list_running_processes_emits_json_lines_when_piped(monkeypatch, capsys):
+    procs = [
+        {"pid": "1", "user": "root", "name": "init"},
+        {"pid": "42", "user": "u0_a1", "name": "app"},
+    ]
+    monkeypatch.setattr(device.processes, "list_processes", lambda serial: procs)
+
+    device.list_running_processes("serial123")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == procs
+
+
+def test_list_installed_packages_keeps_diagnostics_off_piped_stdout(monkeypatch, capsys):
+    def broken(serial):
+        raise RuntimeError("adb is not installed or not found in PATH")
+
+    monkeypatch.setattr(device.service, "list_packages", broken)
+
+    list_installed_packages("serial123")
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "[X] adb is not installed" in captured.err
+
+
+def test_show_connected_devices_fills_missing_ids(monkeypatch, capsys):
+    from devices.types import DeviceInfo
+
+    devs = [DeviceInfo(serial="emulator-5554", state="device", model="Pixel_7")]
+    monkeypatch.setattr(device.service, "discover", lambda: devs)
+
+    device.show_connected_devices()
+
+    row = capsys.readouterr().out.strip().splitlines()[-1]
+    cells = [c.strip() for c in row.split("|")]
+    assert cells == ["emulator-5554", "device", "-", "Pixel_7", "-", "-"]
+
+
+def test_scan_dangerous_permissions_renders_table(monkeypatch, capsys):
+    risky = [
+        {
+            "package": "com.example.cam",
+            "permissions": ["android.permission.CAMERA", "android.permission.RECORD_AUDIO"],
+            "risk_score": 2,
+            "categories": ["media"],
+        }
+    ]
+    monkeypatch.setattr(device.packages, "scan_for_dangerous_permissions", lambda serial: risky)
+    monkeypatch.setattr(device, "_interactive", lambda: True)
+
+    device.scan_dangerous_permissions("serial123")
+
+    out = capsys.readouterr().out
+    assert "com.example.cam" in out and "media" in out
+    assert "android.permission.CAMERA, " in out
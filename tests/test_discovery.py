@@ -42,3 +42,23 @@ def test_no_devices_prints_fedora_hint(monkeypatch, capsys):
     assert "SELinux" in out
     assert "ANDROID_ANALYSIS_SETUP.md" in out
 
+
+
+def test_iter_devices_l_streams_device_lines():
+    output = (
+        "List of devices attached\n"
+        "emulator-5554 device product:sdk model:Pixel_7 transport_id:1\n"
+        "\n"
+        "R58M unauthorized usb:1-1\n"
+    )
+    devices = discovery.iter_devices_l(output)
+    first = next(devices)
+    assert first == {
+        "serial": "emulator-5554",
+        "state": "device",
+        "product": "sdk",
+        "model": "Pixel_7",
+        "transport_id": "1",
+    }
+    assert [d["serial"] for d in devices] == ["R58M"]
+    assert discovery.parse_devices_l(output)[1]["state"] == "unauthorized"
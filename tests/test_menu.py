@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.modules.pop("platform", None)
+
+from cli import menu
+
+
+def test_device_online_reuses_recent_state(monkeypatch):
+    calls = []
+
+    def fake_run(args, timeout=8):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="device\n", stderr="")
+
+    monkeypatch.setattr(menu.adb, "_run_adb", fake_run)
+    monkeypatch.setattr(menu, "_online_cache", {})
+
+    assert menu.device_online("serial123")
+    assert menu.device_online("serial123")
+    assert calls == [["-s", "serial123", "get-state"]]
@@ -44,3 +44,70 @@ def test_inventory_packages_categorises_and_scores(monkeypatch):
         "android.permission.READ_SMS",
         "android.permission.RECORD_AUDIO",
     ]
+
+
+def test_inventory_packages_batches_dumpsys_calls(monkeypatch):
+    list_output = (
+        "package:/data/app/com.whatsapp/base.apk=com.whatsapp installer=com.android.vending\n"
+        "package:/system/app/Camera/Camera.apk=com.android.camera\n"
+    )
+    calls = []
+
+    def fake_run(args, timeout=10):
+        cmd = " ".join(args)
+        calls.append(cmd)
+        if "pm list packages" in cmd:
+            return subprocess.CompletedProcess(args, 0, stdout=list_output, stderr="")
+        sentinel = packages._BATCH_SENTINEL
+        stdout = (
+            f"versionName=2.0\nuses-permission:android.permission.READ_SMS\n{sentinel}\n"
+            f"versionName=13\nuses-permission:android.permission.CAMERA\n{sentinel}\n"
+        )
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(packages, "_run_adb", fake_run)
+
+    result = {p["package"]: p for p in packages.inventory_packages("serial123")}
+    assert len(calls) == 2
+    assert result["com.whatsapp"]["version_name"] == "2.0"
+    assert result["com.whatsapp"]["dangerous_permissions"] == ["android.permission.READ_SMS"]
+    assert result["com.android.camera"]["version_name"] == "13"
+    assert result["com.android.camera"]["dangerous_permissions"] == ["android.permission.CAMERA"]
+
+
+def test_list_installed_package_paths_handles_equals_in_path(monkeypatch):
+    list_output = (
+        "package:/data/app/~~Qx7w==/com.whatsapp-9Zk1==/base.apk=com.whatsapp\n"
+        "package:/system/app/Camera/Camera.apk=com.android.camera\n"
+    )
+
+    def fake_run(args, timeout=10):
+        assert args[-3:] == ["list", "packages", "-f"]
+        return subprocess.CompletedProcess(args, 0, stdout=list_output, stderr="")
+
+    monkeypatch.setattr(packages, "_run_adb", fake_run)
+
+    assert packages.list_installed_package_paths("serial123") == {
+        "com.whatsapp": "/data/app/~~Qx7w==/com.whatsapp-9Zk1==/base.apk",
+        "com.android.camera": "/system/app/Camera/Camera.apk",
+    }
+
+
+def test_package_listings_split_on_last_equals(monkeypatch):
+    path = "/data/app/~~a==/com.whatsapp-1==/base.apk"
+    list_output = f"package:{path}=com.whatsapp installer=com.android.vending\n"
+
+    def fake_run(args, timeout=10):
+        cmd = " ".join(args)
+        if "pm list packages" in cmd:
+            return subprocess.CompletedProcess(args, 0, stdout=list_output, stderr="")
+        assert "dumpsys package com.whatsapp" in cmd
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(packages, "_run_adb", fake_run)
+
+    app = packages.inventory_packages("serial123")[0]
+    assert (app["package"], app["path"]) == ("com.whatsapp", path)
+
+    list_output = f"package:{path}=com.whatsapp\n"
+    assert packages.list_installed_package_paths("serial123") == {"com.whatsapp": path}
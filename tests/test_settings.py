@@ -100,3 +100,17 @@ def test_health_check_reports_missing_adb(monkeypatch, tmp_path, capsys):
     captured = capsys.readouterr()
     text = (captured.out + captured.err).lower()
     assert "adb missing" in text
+
+
+def test_health_check_reuses_adb_version(monkeypatch, tmp_path):
+    calls = tmp_path / "calls"
+    fake = tmp_path / "adb"
+    fake.write_text(f'#!/bin/sh\necho x >> "{calls}"\necho "Android Debug Bridge version 1.0.41"\n')
+    fake.chmod(fake.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("ADB", str(fake))
+    settings.get_settings.cache_clear()
+    health._adb_version.cache_clear()
+
+    assert health._check_adb() == (True, "Android Debug Bridge version 1.0.41")
+    assert health._check_adb()[0] is True
+    assert calls.read_text().count("x") == 1
@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.modules.pop("platform", None)
+
+from cli.actions import system
+from core.diagnostics import CheckResult
+
+
+def test_run_doctor_reuses_cached_module_results(monkeypatch, tmp_path: Path, capsys):
+    imported = []
+
+    def fake_module_run(self):
+        imported.append(self.name)
+        return CheckResult(self.category, self.name, self.name != "androguard", "1.0")
+
+    monkeypatch.setattr(system, "_CACHE_PATH", tmp_path / "doctor.json")
+    monkeypatch.setattr(system.ModuleCheck, "run", fake_module_run)
+    monkeypatch.setattr(
+        system.BinaryCheck, "run", lambda self: CheckResult(self.category, self.name, True, "/bin/x")
+    )
+
+    system.run_doctor()
+    first = capsys.readouterr()
+    assert sorted(imported) == sorted(system._MODULES)
+
+    imported.clear()
+    system.run_doctor()
+    second = capsys.readouterr()
+
+    # Only the failed check is retried; passing modules come from the cache.
+    assert imported == ["androguard"]
+    assert first.out == second.out
+    assert "fastapi : 1.0" in second.out
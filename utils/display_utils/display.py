@@ -14,12 +14,13 @@ from __future__ import annotations
 
 import os
 import shutil
+import sys
 from textwrap import wrap
 from typing import Iterable, Sequence, Any, Optional, Callable, List
 
 from app_config import app_config
 from . import table as tables
-from .status import info, ok, warn, fail
+from .status import info, ok, warn, fail, note
 
 # -----------------------------
 # Terminal / layout
@@ -92,9 +93,7 @@ def print_app_banner(subtitle: Optional[str] = None, *, boxed: bool = False) ->
 
 def print_section(title: str, underline: str = "=") -> None:
     """Section header with a blank line around it."""
-    print()
-    print(header(title, underline=underline))
-    print()
+    sys.stdout.write(f"\n{header(title, underline=underline)}\n\n")
 
 
 def render_menu(
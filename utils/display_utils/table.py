@@ -8,6 +8,7 @@ Pure ASCII table rendering with width handling and safe truncation.
 
 from __future__ import annotations
 import shutil
+import sys
 from typing import Iterable, Sequence, Optional, Any, List
 
 
@@ -85,9 +86,12 @@ def print_table(rows: Iterable[Sequence[Any]],
             cells.append(f"{_truncate(cell, w):<{w}}")
         return " | ".join(cells)
 
+    lines: List[str] = []
     if headers:
-        print(fmt_row(list(headers)))
-        print("-" * min(sum(widths) + 3 * (len(widths) - 1), max_w))
+        lines.append(fmt_row(list(headers)))
+        lines.append("-" * min(sum(widths) + 3 * (len(widths) - 1), max_w))
+    lines.extend(fmt_row(r) for r in string_rows)
 
-    for r in string_rows:
-        print(fmt_row(r))
+    # One write for the whole table instead of a print() (and stdout lock) per row.
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -138,9 +138,10 @@ def configure_logging(mode: str, log_to_stdout: bool = False) -> None:
     mode:
         One of ``"cli"``, ``"server"`` or ``"job"`` to select the target log file.
     log_to_stdout:
-        If ``True`` a stream handler is added. Regardless of this flag, setting
-        the ``ROTTERDAM_LOG_TO_STDOUT`` environment variable enables stdout
-        logging. The server mode always logs to stdout.
+        If ``True`` a console stream handler is added. Regardless of this flag,
+        setting the ``ROTTERDAM_LOG_TO_STDOUT`` environment variable enables
+        console logging. The server mode always logs to the console. Console
+        records are written to stderr, keeping stdout for command output.
     """
 
     repo_root = Path(__file__).resolve().parents[2]
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from contextlib import redirect_stdout
+from functools import lru_cache
 from io import StringIO
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence
 
@@ -23,21 +24,35 @@ def ieee_table(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
     return buf.getvalue().rstrip()
 
 
+_DEVICE_HEADERS = ("Serial", "State", "Product", "Model", "Device", "Transport")
+
+
+@lru_cache(maxsize=32)
+def _device_inventory_table(rows: tuple[tuple[str, ...], ...], width: int) -> str:
+    buf = StringIO()
+    with redirect_stdout(buf):
+        display.print_table(rows, headers=_DEVICE_HEADERS, max_width=width)
+    return buf.getvalue().rstrip()
+
+
 def format_device_inventory(devices: List[DeviceInfo]) -> str:
-    """Return a table summarizing connected devices."""
-    rows = [
-        [
+    """Return a table summarizing connected devices.
+
+    The rendered table is memoised on the displayed values and terminal
+    width, so re-listing an unchanged device set skips the layout work.
+    """
+    rows = tuple(
+        (
             getattr(d, "serial", "") or "-",
             getattr(d, "state", "") or "-",
             getattr(d, "product", "") or "-",
             getattr(d, "model", "") or "-",
             getattr(d, "device", "") or "-",
             getattr(d, "transport_id", getattr(d, "transport", "-")) or "-",
-        ]
+        )
         for d in devices
-    ]
-    headers = ["Serial", "State", "Product", "Model", "Device", "Transport"]
-    return ieee_table(headers, rows)
+    )
+    return _device_inventory_table(rows, display.term_width())
 
 
 def format_evidence_log(entries: Iterable[Dict[str, Any]]) -> str: